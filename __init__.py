@@ -5,9 +5,85 @@ Works with all node types: Shader, Compositor, World, Geometry Nodes, etc.
 """
 
 import bpy
+import math
 import time
-from collections import defaultdict
-from mathutils import Vector
+from functools import lru_cache
+
+
+# Monotonic clock for sample timestamps, immune to wall-clock adjustments
+_mono = time.monotonic
+
+# NumPy is imported when detection starts, see _get_np()
+_np = None
+
+
+def _get_np():
+    """Import NumPy on first use so enabling the add-on stays fast."""
+    global _np
+    if _np is None:
+        import numpy
+        _np = numpy
+    return _np
+
+
+# Numba-compiled detect_window(), None when Numba is not installed
+_detect_window_jit = None
+_numba_checked = False
+
+
+def _get_detect_window_jit():
+    """Compile detect_window() with Numba the first time, if Numba is available."""
+    global _detect_window_jit, _numba_checked
+    if not _numba_checked:
+        _numba_checked = True
+        try:
+            from numba import njit
+            
+            # An explicit signature compiles right away, so the cost is paid
+            # when detection is switched on rather than in the middle of a drag
+            _detect_window_jit = njit(
+                "boolean(float64[:, ::1], int64, float64, int64, float64, float64)",
+                cache=True,
+                fastmath=True,
+            )(detect_window)
+        except Exception:
+            # Numba is optional: missing, mismatched with NumPy or unable to
+            # compile, detection falls back to the NumPy path
+            _detect_window_jit = None
+    return _detect_window_jit
+
+
+TIMER_INTERVAL = 0.02  # 50 FPS check while nodes are moving
+IDLE_TIMER_INTERVAL = 0.25  # Slower check once nothing has moved for a while
+IDLE_TICKS = 25  # Ticks without movement before slowing down (0.5s)
+PRUNE_INTERVAL = 2.0  # Seconds between sweeps for nodes that stopped being tracked
+
+# Consecutive moves count as a reversal when cos(angle) < -REVERSAL_COS, i.e.
+# roughly opposite, more than 107 degrees apart. The detectors compare squared.
+REVERSAL_COS = 0.3
+REVERSAL_COS_SQ = REVERSAL_COS ** 2
+
+# Displacement floor for the wiggle ratio, so a node back at its start point
+# does not divide by zero
+MIN_DISPLACEMENT = 0.1
+MIN_DISPLACEMENT_SQ = MIN_DISPLACEMENT ** 2
+
+# Without Numba, batches of up to this many windows are checked in plain Python
+PYTHON_DETECT_MAX = 8
+
+# Samples kept per node; covers the longest time window (2s) at the timer rate.
+# Must be a power of two so ring buffer indices can wrap with a bit mask.
+HISTORY_LENGTH = 128
+HISTORY_MASK = HISTORY_LENGTH - 1
+
+
+class NodeState:
+    """Everything tracked for one node, looked up with a single dict access."""
+    __slots__ = ('row', 'last_pos')
+    
+    def __init__(self, row):
+        self.row = row  # row of the node's samples in the tracker arrays
+        self.last_pos = None  # position seen on the previous tick
 
 
 # Store movement history per node
@@ -16,11 +92,74 @@ class WiggleTracker:
         self.reset()
     
     def reset(self):
-        self.positions = {}  # node_name -> list of (time, position) tuples
-        self.last_check = {}  # node_name -> last check time
-        self.direction_changes = {}  # node_name -> count of direction changes
-        self.last_direction = {}  # node_name -> last movement direction
-        self.wiggle_start_time = {}  # node_name -> when wiggle detection started
+        # One ring buffer of (time, x, y) samples per tracked node, stored as rows
+        # of shared arrays so all selected nodes can be processed in one pass
+        self.states = {}  # node_name -> NodeState
+        self.free_rows = []
+        # The arrays are allocated by _grow() once the first node is tracked
+        self.history = None  # (time, x, y) samples, per row
+        self.head = None  # next slot to write, per row
+        self.count = None  # samples in the window, per row
+        self.bbox = None  # (xmin, ymin, xmax, ymax) of the window, per row
+    
+    def add(self, node_name):
+        """Start tracking a node and return its state."""
+        if not self.free_rows:
+            self._grow()
+        
+        state = NodeState(self.free_rows.pop())
+        self.head[state.row] = 0
+        self.count[state.row] = 0
+        self.states[node_name] = state
+        return state
+    
+    def release(self, node_name):
+        """Stop tracking a node and recycle its row."""
+        state = self.states.pop(node_name, None)
+        if state is not None:
+            self.free_rows.append(state.row)
+    
+    def prune(self, current_time, max_age, keep):
+        """Stop tracking nodes not in keep whose newest sample is older than max_age."""
+        for node_name, state in list(self.states.items()):
+            if node_name in keep:
+                continue
+            
+            newest = self.history[state.row, (self.head[state.row] - 1) & HISTORY_MASK, 0]
+            if current_time - newest > max_age:
+                self.release(node_name)
+    
+    def _grow(self):
+        size = 0 if self.head is None else len(self.head)
+        new_size = max(8, size * 2)
+        
+        history = _np.zeros((new_size, HISTORY_LENGTH, 3))
+        head = _np.zeros(new_size, dtype=_np.int64)
+        count = _np.zeros(new_size, dtype=_np.int64)
+        bbox = _np.zeros((new_size, 4))
+        if size:
+            history[:size] = self.history
+            head[:size] = self.head
+            count[:size] = self.count
+            bbox[:size] = self.bbox
+        
+        self.history = history
+        self.head = head
+        self.count = count
+        self.bbox = bbox
+        
+        # Reversed so rows are handed out in ascending order
+        self.free_rows.extend(range(new_size - 1, size - 1, -1))
+    
+    def window(self, rows, heads, counts):
+        """
+        Gather the (x, y) windows of the given rows, oldest first, padded to the
+        longest one. Returns the positions and a mask of the valid samples.
+        """
+        offsets = _np.arange(counts.max())
+        valid = offsets < counts[:, None]
+        index = (heads[:, None] - counts[:, None] + offsets) & HISTORY_MASK
+        return self.history[rows[:, None], index, 1:], valid
 
 
 tracker = WiggleTracker()
@@ -37,81 +176,265 @@ def get_node_tree(context):
     return tree
 
 
-def disconnect_node(node_tree, node):
-    """Remove all links connected to the given node."""
+def disconnect_nodes(node_tree, nodes):
+    """
+    Remove all links connected to any of the given nodes in a single scan.
+    Returns the number of removed links for each node, in order.
+    """
+    # Compare integer pointers, RNA struct equality is much slower
+    index = {node.as_pointer(): i for i, node in enumerate(nodes)}
+    missing = len(nodes)
+    removed = [0] * len(nodes)
     links_to_remove = []
     
     for link in node_tree.links:
-        if link.from_node == node or link.to_node == node:
+        # A link between two of the nodes counts for the one listed first
+        i = min(
+            index.get(link.from_node.as_pointer(), missing),
+            index.get(link.to_node.as_pointer(), missing),
+        )
+        if i != missing:
+            removed[i] += 1
             links_to_remove.append(link)
     
     for link in links_to_remove:
         node_tree.links.remove(link)
     
-    return len(links_to_remove)
+    return removed
 
 
-def detect_wiggle(node_name, current_pos, settings):
+def detect_window(xy, count, min_move_sq, direction_changes_threshold,
+                  wiggle_ratio_sq, min_total_distance):
     """
-    Detect if a node is being wiggled based on rapid direction changes.
-    Returns True if wiggle is detected.
+    Wiggle test for a single window, the same one detect_wiggles runs on a
+    batch, written as plain loops so Numba can compile it.
+    xy holds the window positions oldest first; only the first count are used.
     """
-    current_time = time.time()
-    
-    # Initialize tracking for new nodes
-    if node_name not in tracker.positions:
-        tracker.positions[node_name] = []
-        tracker.direction_changes[node_name] = 0
-        tracker.last_direction[node_name] = None
-        tracker.wiggle_start_time[node_name] = current_time
-    
-    positions = tracker.positions[node_name]
-    
-    # Add current position
-    positions.append((current_time, Vector(current_pos)))
+    total_distance = 0.0
+    direction_changes = 0
     
-    # Keep only recent positions within time window
-    time_window = settings.time_window
-    positions[:] = [(t, p) for t, p in positions if current_time - t < time_window]
+    # Last move above min_movement, used to spot reversals
+    has_direction = False
+    last_dx = 0.0
+    last_dy = 0.0
+    last_sq_length = 0.0
+    
+    for i in range(1, count):
+        dx = xy[i, 0] - xy[i - 1, 0]
+        dy = xy[i, 1] - xy[i - 1, 1]
+        sq_length = dx * dx + dy * dy
+        total_distance += math.sqrt(sq_length)
+        
+        if sq_length > min_move_sq:
+            if has_direction:
+                # Reversal test compared squared, as in detect_wiggles
+                dot = dx * last_dx + dy * last_dy
+                if dot < 0.0 and dot * dot > REVERSAL_COS_SQ * sq_length * last_sq_length:
+                    direction_changes += 1
+            
+            has_direction = True
+            last_dx = dx
+            last_dy = dy
+            last_sq_length = sq_length
+    
+    dx = xy[count - 1, 0] - xy[0, 0]
+    dy = xy[count - 1, 1] - xy[0, 1]
+    sq_displacement = max(dx * dx + dy * dy, MIN_DISPLACEMENT_SQ)
+    
+    return (
+        direction_changes >= direction_changes_threshold and
+        total_distance * total_distance > wiggle_ratio_sq * sq_displacement and
+        total_distance > min_total_distance
+    )
+
+
+# One unrolled step of the generated window detectors, see make_window_detector()
+_DETECTOR_STEP = """
+    x{b}, y{b} = xy[{i}]
+    dx = x{b} - x{a}
+    dy = y{b} - y{a}
+    sq_length = dx * dx + dy * dy
+    total_distance += sqrt(sq_length)
+    if sq_length > min_move_sq:
+        if has_direction:
+            dot = dx * last_dx + dy * last_dy
+            if dot < 0.0 and dot * dot > REVERSAL_COS_SQ * sq_length * last_sq_length:
+                direction_changes += 1
+        has_direction = True
+        last_dx = dx
+        last_dy = dy
+        last_sq_length = sq_length
+"""
+
+
+@lru_cache(maxsize=HISTORY_LENGTH)
+def make_window_detector(count):
+    """
+    Generate detect_window() unrolled for windows of exactly count positions.
+    The generated function takes the window as a list of (x, y) pairs, which
+    plain Python reads much faster than a NumPy array. While a node is dragged
+    its window length barely changes, so only a few variants get built.
+    """
+    steps = "".join(
+        _DETECTOR_STEP.format(i=i, a=(i - 1) % 2, b=i % 2)
+        for i in range(1, count)
+    )
+    source = f"""
+def detect_window_{count}(xy, min_move_sq, direction_changes_threshold,
+                          wiggle_ratio_sq, min_total_distance):
+    total_distance = 0.0
+    direction_changes = 0
+    has_direction = False
+    last_dx = last_dy = last_sq_length = 0.0
+    x0, y0 = xy[0]
+{steps}
+    dx = xy[{count - 1}][0] - xy[0][0]
+    dy = xy[{count - 1}][1] - xy[0][1]
+    sq_displacement = max(dx * dx + dy * dy, MIN_DISPLACEMENT_SQ)
+    return (
+        direction_changes >= direction_changes_threshold and
+        total_distance * total_distance > wiggle_ratio_sq * sq_displacement and
+        total_distance > min_total_distance
+    )
+"""
+    namespace = {
+        'sqrt': math.sqrt,
+        'REVERSAL_COS_SQ': REVERSAL_COS_SQ,
+        'MIN_DISPLACEMENT_SQ': MIN_DISPLACEMENT_SQ,
+    }
+    exec(source, namespace)
+    return namespace[f'detect_window_{count}']
+
+
+def detect_wiggles(states, positions, cfg, current_time):
+    """
+    Record new positions for a batch of node states and detect which of them are
+    being wiggled based on rapid direction changes.
+    cfg is the settings snapshot built by WIGGLE_OT_monitor.check_nodes and
+    current_time the tick's _mono() reading.
+    Returns a boolean array aligned with states.
+    """
+    (time_window, min_move_sq, direction_changes_threshold,
+     wiggle_ratio_sq, min_total_distance) = cfg
+    rows = _np.array([state.row for state in states])
+    positions = _np.asarray(positions, dtype=float)
+    
+    # Add current positions at the head of each ring buffer
+    heads = tracker.head[rows]
+    slots = heads & HISTORY_MASK
+    tracker.history[rows, slots, 0] = current_time
+    tracker.history[rows, slots, 1:] = positions
+    heads += 1
+    old_counts = tracker.count[rows]
+    counts = _np.minimum(old_counts + 1, HISTORY_LENGTH)
+    
+    # Drop positions that fell out of the time window. Timestamps only grow, so
+    # stale samples are always the oldest ones in a window.
+    offsets = _np.arange(counts.max())
+    index = (heads[:, None] - counts[:, None] + offsets) & HISTORY_MASK
+    stale = (
+        (offsets < counts[:, None]) &
+        (current_time - tracker.history[rows[:, None], index, 0] >= time_window)
+    )
+    counts -= stale.sum(axis=1)
+    
+    tracker.head[rows] = heads
+    tracker.count[rows] = counts
+    
+    # Gather the windows once, both the bounding boxes and the geometry use them
+    xy, valid = tracker.window(rows, heads, counts)
+    
+    # Grow each window's bounding box by the new position, or rebuild it when
+    # the window is new or lost samples
+    bbox = tracker.bbox[rows]
+    bbox[:, :2] = _np.minimum(bbox[:, :2], positions)
+    bbox[:, 2:] = _np.maximum(bbox[:, 2:], positions)
+    rebuild = (old_counts == 0) | (counts <= old_counts)
+    if rebuild.any():
+        rebuild_xy = xy[rebuild]
+        rebuild_valid = valid[rebuild, :, None]
+        bbox[rebuild, :2] = _np.where(rebuild_valid, rebuild_xy, _np.inf).min(axis=1)
+        bbox[rebuild, 2:] = _np.where(rebuild_valid, rebuild_xy, -_np.inf).max(axis=1)
+    tracker.bbox[rows] = bbox
+    
+    # No move can be longer than the bounding box diagonal. Windows whose box
+    # is too small to hold a single move above min_movement, or to add up to
+    # min_total_distance over all their moves, cannot be wiggling.
+    size = bbox[:, 2:] - bbox[:, :2]
+    diagonal_sq = _np.einsum('ij,ij->i', size, size)
+    candidates = (
+        (counts >= 3) &  # Need at least 3 positions to detect direction change
+        (diagonal_sq > min_move_sq) &
+        ((counts - 1) ** 2 * diagonal_sq > min_total_distance ** 2)
+    )
     
-    # Need at least 3 positions to detect direction change
-    if len(positions) < 3:
-        return False
+    is_wiggling = _np.zeros(len(rows), dtype=bool)
+    if not candidates.any():
+        return is_wiggling
+    
+    # With Numba, a compiled loop per window beats dispatching the NumPy
+    # calls below on windows of a few dozen samples
+    detect_window_jit = _detect_window_jit
+    if detect_window_jit is not None:
+        for i in _np.flatnonzero(candidates):
+            is_wiggling[i] = detect_window_jit(xy[i], counts[i], *cfg[1:])
+        return is_wiggling
+    
+    # Otherwise a few windows are still faster through generated plain Python
+    candidate_indices = _np.flatnonzero(candidates)
+    if len(candidate_indices) <= PYTHON_DETECT_MAX:
+        for i in candidate_indices:
+            count = int(counts[i])
+            detect_window_python = make_window_detector(count)
+            is_wiggling[i] = detect_window_python(xy[i, :count].tolist(), *cfg[1:])
+        return is_wiggling
+    
+    counts = counts[candidates]
+    xy = xy[candidates]
+    valid = valid[candidates]
+    
+    # Movement vectors between consecutive positions and their squared lengths
+    deltas = _np.diff(xy, axis=1)
+    sq_lengths = _np.einsum('ijk,ijk->ij', deltas, deltas)
+    sq_lengths[~valid[:, 1:]] = 0.0
+    
+    # Only moves above the threshold count as a direction. Pack them to the
+    # front of each row so consecutive directions sit next to each other.
+    moving = sq_lengths > min_move_sq
+    order = _np.argsort(~moving, axis=1, kind='stable')
+    directions = _np.take_along_axis(deltas, order[:, :, None], axis=1)
+    dir_sq_lengths = _np.take_along_axis(sq_lengths, order, axis=1)
+    pairs = _np.arange(sq_lengths.shape[1] - 1) < moving.sum(axis=1)[:, None] - 1
+    
+    # Count direction reversals (dot product negative means opposite direction).
+    # cos < -REVERSAL_COS is tested as dot < 0 and
+    # dot^2 > REVERSAL_COS_SQ * |a|^2 * |b|^2 to skip normalizing.
+    dots = _np.einsum('ijk,ijk->ij', directions[:, 1:], directions[:, :-1])
+    reversals = (
+        pairs &
+        (dots < 0.0) &
+        (dots * dots > REVERSAL_COS_SQ * dir_sq_lengths[:, 1:] * dir_sq_lengths[:, :-1])
+    )
+    direction_changes = reversals.sum(axis=1)
     
-    # Calculate movement directions between consecutive positions
-    directions = []
-    for i in range(1, len(positions)):
-        delta = positions[i][1] - positions[i-1][1]
-        if delta.length > settings.min_movement:
-            directions.append(delta.normalized())
+    # Calculate total distance moved from the move lengths computed above
+    total_distance = _np.sqrt(sq_lengths).sum(axis=1)
     
-    if len(directions) < 2:
-        return False
+    # Calculate squared displacement (start to end)
+    displacement = xy[_np.arange(len(counts)), counts - 1] - xy[:, 0]
+    sq_displacement = _np.einsum('ij,ij->i', displacement, displacement)
     
-    # Count direction reversals (dot product negative means opposite direction)
-    direction_changes = 0
-    for i in range(1, len(directions)):
-        dot = directions[i].dot(directions[i-1])
-        if dot < -0.3:  # Roughly opposite direction (more than 107 degrees)
-            direction_changes += 1
-    
-    # Calculate total distance moved
-    total_distance = sum(
-        (positions[i][1] - positions[i-1][1]).length 
-        for i in range(1, len(positions))
+    # Wiggle ratio: high movement but low displacement means wiggling.
+    # total / max(displacement, MIN_DISPLACEMENT) > threshold, compared squared.
+    is_high_ratio = (
+        total_distance ** 2 > wiggle_ratio_sq * _np.maximum(sq_displacement, MIN_DISPLACEMENT_SQ)
     )
     
-    # Calculate displacement (start to end)
-    displacement = (positions[-1][1] - positions[0][1]).length
-    
-    # Wiggle ratio: high movement but low displacement means wiggling
-    wiggle_ratio = total_distance / max(displacement, 0.1)
-    
     # Detect wiggle: enough direction changes and high wiggle ratio
-    is_wiggling = (
-        direction_changes >= settings.direction_changes_threshold and
-        wiggle_ratio > settings.wiggle_ratio_threshold and
-        total_distance > settings.min_total_distance
+    is_wiggling[candidates] = (
+        (direction_changes >= direction_changes_threshold) &
+        is_high_ratio &
+        (total_distance > min_total_distance)
     )
     
     return is_wiggling
@@ -119,14 +442,10 @@ def detect_wiggle(node_name, current_pos, settings):
 
 def clear_node_tracking(node_name):
     """Clear tracking data for a node after disconnect."""
-    if node_name in tracker.positions:
-        del tracker.positions[node_name]
-    if node_name in tracker.direction_changes:
-        del tracker.direction_changes[node_name]
-    if node_name in tracker.last_direction:
-        del tracker.last_direction[node_name]
-    if node_name in tracker.wiggle_start_time:
-        del tracker.wiggle_start_time[node_name]
+    state = tracker.states.get(node_name)
+    if state is not None:
+        # Keep last_pos so the node only records samples again once it moves
+        tracker.count[state.row] = 0
 
 
 class WIGGLE_OT_monitor(bpy.types.Operator):
@@ -136,60 +455,164 @@ class WIGGLE_OT_monitor(bpy.types.Operator):
     bl_options = {'INTERNAL'}
     
     _timer = None
-    _last_positions = {}
+    _selected_cache = []  # (node, node_key) for every node selected last tick
+    _interval = TIMER_INTERVAL
+    _idle_ticks = 0
+    _last_prune = 0.0
+    
+    # Bumped by every execute(). Toggling off and on within one timer tick
+    # starts a new monitor before the old one has seen enabled == False, so an
+    # outdated monitor stops on its next event and only one ever keeps running.
+    latest_run = 0
+    _run = 0
     
     def modal(self, context, event):
+        if self._run != WIGGLE_OT_monitor.latest_run:
+            self.cancel(context)
+            return {'CANCELLED'}
+        
+        # Every event in the window passes through here, so anything but the
+        # timer leaves before touching scene data. Nothing here tags a redraw,
+        # the operator only watches and edits links.
+        event_type = event.type
+        if event_type != 'TIMER':
+            if event_type in {'MOUSEMOVE', 'LEFTMOUSE'} and self._selected_cache:
+                # The user may be about to drag the selection, check at full rate
+                self._idle_ticks = 0
+                self.set_interval(context, TIMER_INTERVAL)
+            return {'PASS_THROUGH'}
+        
         settings = context.scene.wiggle_settings
         
         if not settings.enabled:
             self.cancel(context)
             return {'CANCELLED'}
         
-        if event.type == 'TIMER':
-            node_tree = get_node_tree(context)
-            if node_tree:
-                self.check_nodes(context, node_tree, settings)
+        node_tree = get_node_tree(context)
+        if node_tree and self.check_nodes(context, node_tree, settings):
+            self._idle_ticks = 0
+            self.set_interval(context, TIMER_INTERVAL)
+        else:
+            self._idle_ticks += 1
+            if self._idle_ticks >= IDLE_TICKS:
+                self.set_interval(context, IDLE_TIMER_INTERVAL)
         
         return {'PASS_THROUGH'}
     
+    def set_interval(self, context, interval):
+        """Re-add the timer when the check rate changes."""
+        if interval == self._interval:
+            return
+        
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        self._timer = wm.event_timer_add(interval, window=context.window)
+        self._interval = interval
+    
     def check_nodes(self, context, node_tree, settings):
-        """Check all selected nodes for wiggling."""
-        for node in node_tree.nodes:
-            if node.select:
-                node_key = f"{id(node_tree)}_{node.name}"
-                current_pos = (node.location.x, node.location.y)
-                
-                # Check if position changed
-                last_pos = self._last_positions.get(node_key)
-                if last_pos != current_pos:
-                    self._last_positions[node_key] = current_pos
-                    
-                    # Check for wiggle
-                    if detect_wiggle(node_key, current_pos, settings):
-                        # Disconnect the node!
-                        num_removed = disconnect_node(node_tree, node)
-                        if num_removed > 0:
-                            self.report({'INFO'}, f"Disconnected '{node.name}' ({num_removed} links)")
-                            clear_node_tracking(node_key)
+        """
+        Check all selected nodes for wiggling.
+        Returns True if any selected node moved since the last check.
+        """
+        moved_nodes = []
+        moved_keys = []
+        moved_states = []
+        moved_positions = []
+        
+        # Collect the selection fresh every tick: node references must not be
+        # held across undo, and no cheaper signal catches every selection change.
+        # Pointers stay stable across renames, unlike node names, and an
+        # integer tuple is cheaper to hash than a formatted string.
+        tree_ptr = node_tree.as_pointer()
+        self._selected_cache = [
+            (node, (tree_ptr, node.as_pointer())) for node in node_tree.nodes if node.select
+        ]
+        
+        # Deselected and deleted nodes would otherwise stay tracked all session.
+        # Selected nodes are kept so their last position survives idle periods.
+        current_time = _mono()
+        if current_time - self._last_prune > PRUNE_INTERVAL:
+            self._last_prune = current_time
+            keep = {node_key for node, node_key in self._selected_cache}
+            tracker.prune(current_time, 2 * settings.time_window, keep)
+        
+        states = tracker.states
+        for node, node_key in self._selected_cache:
+            location = node.location
+            current_pos = (location.x, location.y)
+            
+            state = states.get(node_key)
+            if state is None:
+                state = tracker.add(node_key)
+            
+            # Check if position changed
+            if state.last_pos != current_pos:
+                state.last_pos = current_pos
+                moved_nodes.append(node)
+                moved_keys.append(node_key)
+                moved_states.append(state)
+                moved_positions.append(current_pos)
+        
+        if not moved_nodes:
+            return False
+        
+        # Read the thresholds once per tick, each one is an RNA property access.
+        # Lengths are compared squared, so square them up front.
+        cfg = (
+            settings.time_window,
+            settings.min_movement ** 2,
+            settings.direction_changes_threshold,
+            settings.wiggle_ratio_threshold ** 2,
+            settings.min_total_distance,
+        )
+        
+        # Check every moved node for wiggle in one pass
+        wiggling = detect_wiggles(moved_states, moved_positions, cfg, current_time)
+        if not wiggling.any():
+            return True
+        
+        # Disconnect the wiggling nodes! One scan of the links serves all of them.
+        wiggling_nodes = [node for node, is_wiggling in zip(moved_nodes, wiggling) if is_wiggling]
+        wiggling_keys = [key for key, is_wiggling in zip(moved_keys, wiggling) if is_wiggling]
+        removed = disconnect_nodes(node_tree, wiggling_nodes)
+        
+        for node, node_key, num_removed in zip(wiggling_nodes, wiggling_keys, removed):
+            if num_removed > 0:
+                self.report({'INFO'}, f"Disconnected '{node.name}' ({num_removed} links)")
+                clear_node_tracking(node_key)
+        
+        return True
     
     def execute(self, context):
         if context.area.type != 'NODE_EDITOR':
             self.report({'WARNING'}, "Must be in Node Editor")
             return {'CANCELLED'}
         
+        _get_np()
+        _get_detect_window_jit()
+        
         wm = context.window_manager
-        self._timer = wm.event_timer_add(0.02, window=context.window)  # 50 FPS check
+        self._timer = wm.event_timer_add(TIMER_INTERVAL, window=context.window)
+        self._interval = TIMER_INTERVAL
+        self._idle_ticks = 0
+        self._last_prune = _mono()
         wm.modal_handler_add(self)
         tracker.reset()
-        self._last_positions = {}
+        self._selected_cache = []
+        WIGGLE_OT_monitor.latest_run += 1
+        self._run = WIGGLE_OT_monitor.latest_run
         return {'RUNNING_MODAL'}
     
     def cancel(self, context):
         if self._timer:
             context.window_manager.event_timer_remove(self._timer)
             self._timer = None
-        tracker.reset()
-        self._last_positions = {}
+        self._selected_cache = []
+        
+        # The shared tracker belongs to the newest monitor, leave it alone
+        # when an outdated one stops
+        if self._run == WIGGLE_OT_monitor.latest_run:
+            tracker.reset()
 
 
 class WIGGLE_OT_toggle(bpy.types.Operator):
@@ -224,10 +647,9 @@ class WIGGLE_OT_disconnect_selected(bpy.types.Operator):
             self.report({'WARNING'}, "No active node tree")
             return {'CANCELLED'}
         
-        total_removed = 0
-        for node in node_tree.nodes:
-            if node.select:
-                total_removed += disconnect_node(node_tree, node)
+        # One scan of the links for the whole selection
+        selected = [node for node in node_tree.nodes if node.select]
+        total_removed = sum(disconnect_nodes(node_tree, selected))
         
         if total_removed > 0:
             self.report({'INFO'}, f"Removed {total_removed} links")